@@ -6,8 +6,10 @@ as this is convinient to populate later, on demand)
 
 from __future__ import annotations
 
-from copy import deepcopy
+import re
 from dataclasses import dataclass, field
+from datetime import date
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Final, Literal, Optional
 from warnings import warn
@@ -17,6 +19,18 @@ from ._logging import null_logger
 
 logger: Final = null_logger(__name__)
 
+_MULTI_UNDERSCORE: Final = re.compile(r"_{2,}")
+_STEM_TRANS: Final = str.maketrans(
+    {".": "_", " ": "_", "æ": "ae", "ø": "oe", "å": "aa"}
+)
+
+
+def _get_datestamp(time: Any) -> str:
+    """Get a time value formatted as YYYYMMDD, for use in file names."""
+    if isinstance(time, date):
+        return time.strftime("%Y%m%d")
+    return str(time)[0:10].replace("-", "")
+
 
 @dataclass
 class FileDataProvider:
@@ -86,12 +100,16 @@ class FileDataProvider:
 
         # resolve() will fix ".." e.g. change '/some/path/../other' to '/some/other'
         abspath = path.resolve()
+        abspath_str = str(abspath)
 
-        try:
-            str(abspath).encode("ascii")
-        except UnicodeEncodeError:
-            print(f"!! Path has non-ascii elements which is not supported: {abspath}")
-            raise
+        if not abspath_str.isascii():
+            logger.error(
+                "Path has non-ascii elements which is not supported: %s", abspath_str
+            )
+            idx = next(i for i, char in enumerate(abspath_str) if not char.isascii())
+            raise UnicodeEncodeError(
+                "ascii", abspath_str, idx, idx + 1, "non-ascii path"
+            )
 
         if self.forcefolder_is_absolute:
             # may become meaningsless as forcefolder can be something else, but will try
@@ -113,7 +131,15 @@ class FileDataProvider:
             relpath = path.relative_to(self.rootpath)
 
         logger.info("Derived filedata")
-        return str(relpath), str(abspath)
+        return str(relpath), abspath_str
+
+    @cached_property
+    def _time0_stamp(self) -> str:
+        return _get_datestamp(self.time0)
+
+    @cached_property
+    def _time1_stamp(self) -> str:
+        return _get_datestamp(self.time1)
 
     def _get_filestem(self) -> str:
         """Construct the file"""
@@ -130,11 +156,11 @@ class FileDataProvider:
             stem = self.parentname.lower() + "--" + stem
 
         if self.time0 and not self.time1:
-            stem += "--" + (str(self.time0)[0:10]).replace("-", "")
+            stem += "--" + self._time0_stamp
 
         elif self.time0 and self.time1:
-            monitor = (str(self.time1)[0:10]).replace("-", "")
-            base = (str(self.time0)[0:10]).replace("-", "")
+            monitor = self._time1_stamp
+            base = self._time0_stamp
             if monitor == base:
                 warn(
                     "The monitor date and base date are equal", UserWarning
@@ -144,18 +170,12 @@ class FileDataProvider:
             else:
                 stem += "--" + monitor + "_" + base
 
-        # remove unwanted characters
-        stem = stem.replace(".", "_").replace(" ", "_")
+        # remove unwanted characters and treat norwegian special letters
+        # BUG(?): What about germen letter like "Ü"?
+        stem = stem.translate(_STEM_TRANS)
 
         # avoid multiple double underscores
-        while "__" in stem:
-            stem = stem.replace("__", "_")
-
-        # treat norwegian special letters
-        # BUG(?): What about germen letter like "Ü"?
-        stem = stem.replace("æ", "ae")
-        stem = stem.replace("ø", "oe")
-        return stem.replace("å", "aa")
+        return _MULTI_UNDERSCORE.sub("_", stem)
 
     def _get_path(self) -> tuple[Path, Path | None]:
         """Construct and get the folder path(s)."""
@@ -174,43 +194,50 @@ class FileDataProvider:
 
         return dest, linkdest
 
-    def _get_path_generic(
+    def _get_share_root(
         self,
         mode: Literal[FmuContext.REALIZATION, FmuContext.PREPROCESSED],
-        allow_forcefolder: bool = True,
-        info: str = "",
     ) -> Path:
-        """Generically construct and get the folder path and verify."""
-        dest = None
-
-        outroot = deepcopy(self.rootpath)
-
-        logger.info("FMU context is %s", mode)
+        """Get the root folder for shared data, e.g. 'rootpath/share/results'."""
+        parts: list[str] = []
         if mode == FmuContext.REALIZATION:
             if self.realname:
-                outroot = outroot / self.realname  # TODO: if missing self.realname?
+                parts.append(self.realname)  # TODO: if missing self.realname?
 
             if self.itername:
-                outroot = outroot / self.itername
+                parts.append(self.itername)
 
-        outroot = outroot / "share"
+        parts.append("share")
 
         if mode == FmuContext.PREPROCESSED:
-            outroot = outroot / "preprocessed"
-            if self.dataio.forcefolder and self.dataio.forcefolder.startswith("/"):
-                raise ValueError(
-                    "Cannot use absolute path to 'forcefolder' with preprocessed data"
-                )
+            parts.append("preprocessed")
+        elif self.dataio.is_observation:
+            parts.append("observations")
+        else:
+            parts.append("results")
 
-        if mode != FmuContext.PREPROCESSED:
-            if self.dataio.is_observation:
-                outroot = outroot / "observations"
-            else:
-                outroot = outroot / "results"
+        return self.rootpath.joinpath(*parts)
+
+    def _get_path_generic(
+        self,
+        mode: Literal[FmuContext.REALIZATION, FmuContext.PREPROCESSED],
+        allow_forcefolder: bool = True,
+        info: str = "",
+    ) -> Path:
+        """Generically construct and get the folder path and verify."""
+        logger.info("FMU context is %s", mode)
 
-        dest = outroot / self.efolder  # e.g. "maps"
+        forcefolder = self.dataio.forcefolder
+        forcefolder_absolute = bool(forcefolder) and forcefolder.startswith("/")
 
-        if self.dataio.forcefolder and self.dataio.forcefolder.startswith("/"):
+        if mode == FmuContext.PREPROCESSED and forcefolder_absolute:
+            raise ValueError(
+                "Cannot use absolute path to 'forcefolder' with preprocessed data"
+            )
+
+        dest = self._get_share_root(mode) / self.efolder  # e.g. "maps"
+
+        if forcefolder_absolute:
             if not self.dataio.allow_forcefolder_absolute:
                 raise ValueError(
                     "The forcefolder includes an absolute path, i.e. "
@@ -219,15 +246,15 @@ class FileDataProvider:
                 )
             warn("Using absolute paths in forcefolder is not recommended!")
 
-            # absolute if starts with "/", otherwise relative to outroot
-            dest = Path(self.dataio.forcefolder).absolute()
-            self.forcefolder_is_absolute = True
-
             if not allow_forcefolder:
                 raise RuntimeError(
                     f"You cannot use forcefolder in combination with fmucontext={info}"
                 )
 
+            # absolute if starts with "/", otherwise relative to outroot
+            dest = Path(forcefolder).absolute()
+            self.forcefolder_is_absolute = True
+
         if self.dataio.subfolder:
             dest = dest / self.dataio.subfolder
 
@@ -272,11 +272,11 @@ class FmuProvider:
 
         case_metafile = Path(self._casepath) / ERT_RELATIVE_CASE_METADATA_FILE
         if case_metafile.exists():
-            logger.debug("Case metadata file exists in file %s", str(case_metafile))
+            logger.debug("Case metadata file exists in file %s", case_metafile)
             self._case_metadata = ut.yaml_load(case_metafile, loader="standard")
             logger.debug("Case metadata are: %s", self._case_metadata)
         else:
-            logger.debug("Case metadata file does not exists as %s", str(case_metafile))
+            logger.debug("Case metadata file does not exists as %s", case_metafile)
             warn(
                 "Cannot read case metadata, hence stop retrieving FMU data!",
                 UserWarning,
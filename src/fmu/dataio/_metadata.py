@@ -13,7 +13,6 @@ import platform
 from dataclasses import dataclass, field
 from datetime import timezone
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 from typing import Any, Final
 from warnings import warn
 
@@ -23,8 +22,8 @@ from fmu.dataio._filedata_provider import FileDataProvider
 from fmu.dataio._fmu_provider import FmuProvider
 from fmu.dataio._objectdata_provider import ObjectDataProvider
 from fmu.dataio._utils import (
+    compute_md5,
     drop_nones,
-    export_file_compute_checksum_md5,
     glue_metadata_preprocessed,
     read_metadata_from_file,
 )
@@ -346,16 +345,11 @@ class MetaData:
         if self.compute_md5:
             if not self.objdata.extension.startswith("."):
                 raise ValueError("A extension must start with '.'")
-            with NamedTemporaryFile(
-                buffering=0,
-                suffix=self.objdata.extension,
-            ) as tf:
-                logger.info("Compute MD5 sum for tmp file...: %s", tf.name)
-                self.meta_file["checksum_md5"] = export_file_compute_checksum_md5(
-                    self.obj,
-                    Path(tf.name),
-                    flag=self.dataio._usefmtflag,
-                )
+            self.meta_file["checksum_md5"] = compute_md5(
+                self.obj,
+                self.objdata.extension,
+                flag=self.dataio._usefmtflag,
+            )
         else:
             logger.info("Do not compute MD5 sum at this stage!")
             self.meta_file["checksum_md5"] = None
@@ -86,27 +86,50 @@ data:
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+import math
+import os
+from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, Final, Literal, NamedTuple, Optional, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Literal,
+    NamedTuple,
+    Optional,
+    TypeVar,
+)
 from warnings import warn
 
 import numpy as np
 import pandas as pd
-import xtgeo
 
 from . import dataio, types
 from ._definitions import STANDARD_TABLE_INDEX_COLUMNS, ConfigurationError, ValidFormats
 from ._logging import null_logger
-from ._utils import generate_description, parse_timedata
+from ._utils import parse_timedata
 from .datastructure.export.content import AllowedContent
 from .datastructure.meta import meta, specification
 
+if TYPE_CHECKING:
+    import xtgeo
+
 logger: Final = null_logger(__name__)
 
 V = TypeVar("V")
 
+# the valid formats are only read, hence a single instance is shared
+_VALID_FORMATS: Final = ValidFormats()
+
+_CONTENT_UNSET_MESSAGE: Final = (
+    "The <content> is not provided which defaults to 'unset'. "
+    "It is strongly recommended that content is given explicitly! "
+    f"\n\nValid contents are: {', '.join(AllowedContent.model_fields)} "
+    "\n\nThis list can be extended upon request and need."
+)
+
 
 class SpecificationAndBoundingBox(NamedTuple):
     spec: Dict[str, Any]
@@ -117,8 +140,84 @@ def npfloat_to_float(v: Any) -> Any:
     return float(v) if isinstance(v, (np.float64, np.float32)) else v
 
 
+def _get_spec_items(required: dict, keys: tuple[str, ...]) -> dict[str, Any]:
+    """Get the given items from xtgeo required metadata, with python floats."""
+    return {key: npfloat_to_float(required[key]) for key in keys}
+
+
+_SURFACE_SPEC_KEYS: Final = (
+    "ncol",
+    "nrow",
+    "xori",
+    "yori",
+    "xinc",
+    "yinc",
+    "yflip",
+    "rotation",
+)
+_CUBE_SPEC_KEYS: Final = (
+    "ncol",
+    "nrow",
+    "nlay",
+    "xori",
+    "yori",
+    "zori",
+    "xinc",
+    "yinc",
+    "zinc",
+    "yflip",
+    "zflip",
+    "rotation",
+    "undef",
+)
+_CPGRID_SPEC_KEYS: Final = (
+    "ncol",
+    "nrow",
+    "nlay",
+    "xshift",
+    "yshift",
+    "zshift",
+    "xscale",
+    "yscale",
+    "zscale",
+)
+
+
+def _get_unmasked_min_max(values: np.ma.MaskedArray) -> tuple[float, float]:
+    """Get the min and max of the unmasked values in a masked array.
+
+    Masked min() and max() each make a filled copy of the data first; reducing the
+    data with where= skips those copies.
+    """
+    data = np.ma.getdata(values)
+    mask = np.ma.getmask(values)
+    if mask is np.ma.nomask:
+        return float(data.min()), float(data.max())
+    keep = ~mask
+    return (
+        float(data.min(where=keep, initial=np.inf)),
+        float(data.max(where=keep, initial=-np.inf)),
+    )
+
+
+# The dataclasses below are created for every exported object; explicit __slots__
+# (as dataclass(slots=True) needs python 3.10) avoids a __dict__ per instance.
+
+
 @dataclass
 class DerivedObjectDescriptor:
+    __slots__ = (
+        "subtype",
+        "classname",
+        "layout",
+        "efolder",
+        "fmt",
+        "extension",
+        "spec",
+        "bbox",
+        "table_index",
+    )
+
     subtype: Literal[
         "RegularSurface",
         "Polygons",
@@ -158,37 +257,62 @@ class DerivedObjectDescriptor:
     ]
     fmt: str
     extension: str
-    spec: Dict[str, Any]
-    bbox: Dict[str, Any]
+    spec: Optional[Dict[str, Any]]
+    bbox: Optional[Dict[str, Any]]
     table_index: Optional[list[str]]
 
 
 @dataclass
 class TimedataValueLabel:
+    __slots__ = ("value", "label")
+
     value: str
     label: str
 
     @staticmethod
     def from_list(arr: list) -> TimedataValueLabel:
+        date = str(arr[0])
+        if len(date) == 8 and date.isdigit():
+            # much faster than strptime for the common YYYYMMDD form
+            value = datetime(int(date[0:4]), int(date[4:6]), int(date[6:8]))
+        else:
+            value = datetime.strptime(date, "%Y%m%d")
         return TimedataValueLabel(
-            value=datetime.strptime(str(arr[0]), "%Y%m%d").isoformat(),
+            value=value.isoformat(),
             label=arr[1] if len(arr) == 2 else "",
         )
 
+    def to_dict(self) -> dict[str, str]:
+        return {"value": self.value, "label": self.label}
+
 
 @dataclass
 class TimedataLegacyFormat:
+    __slots__ = ("time",)
+
     time: list[TimedataValueLabel]
 
 
 @dataclass
 class TimedataFormat:
+    __slots__ = ("t0", "t1")
+
     t0: Optional[TimedataValueLabel]
     t1: Optional[TimedataValueLabel]
 
 
 @dataclass
 class DerivedNamedStratigraphy:
+    __slots__ = (
+        "name",
+        "alias",
+        "stratigraphic",
+        "stratigraphic_alias",
+        "offset",
+        "base",
+        "top",
+    )
+
     name: str
     alias: list[str]
 
@@ -211,13 +335,22 @@ def derive_name(
     if name := export.name:
         return name
 
-    if isinstance(name := getattr(obj, "name", ""), str):
-        return name
+    name = getattr(obj, "name", "")
+    return name if isinstance(name, str) else ""
 
-    return ""
+
+def _get_non_stratigraphic_items(name: str) -> dict[str, Any]:
+    """Get the name and stratigraphy items for a name not in the stratigraphy."""
+    return {
+        "name": name,
+        "stratigraphic": False,
+        "offset": None,
+        "alias": [],
+        "top": None,
+        "base": None,
+    }
 
 
-@dataclass
 class ObjectDataProvider:
     """Class for providing metadata for data objects in fmu-dataio, e.g. a surface.
 
@@ -229,26 +362,43 @@ class ObjectDataProvider:
     * investigate current metadata if that is provided
     """
 
-    # input fields
-    obj: Any
-    dataio: Any
-    meta_existing: dict = field(default_factory=dict)
-
-    # result properties; the most important is metadata which IS the 'data' part in
-    # the resulting metadata. But other variables needed later are also given
-    # as instance properties in addition (for simplicity in other classes/functions)
-    bbox: dict = field(default_factory=dict)
-    classname: str = field(default="")
-    efolder: str = field(default="")
-    extension: str = field(default="")
-    fmt: str = field(default="")
-    layout: str = field(default="")
-    metadata: dict = field(default_factory=dict)
-    name: str = field(default="")
-    specs: dict = field(default_factory=dict)
-    subtype: str = field(default="")
-    time0: str = field(default="")
-    time1: str = field(default="")
+    # the set of attributes is fixed, so instances need no __dict__
+    __slots__ = (
+        "obj",
+        "dataio",
+        "meta_existing",
+        "classname",
+        "efolder",
+        "extension",
+        "fmt",
+        "metadata",
+        "name",
+        "time0",
+        "time1",
+    )
+
+    def __init__(
+        self,
+        obj: Any,
+        dataio: Any,
+        meta_existing: Optional[dict] = None,
+    ) -> None:
+        # input fields
+        self.obj = obj
+        self.dataio = dataio
+        self.meta_existing = meta_existing or {}
+
+        # result properties; the most important is metadata which IS the 'data' part
+        # in the resulting metadata. But other variables needed later are also given
+        # as instance properties in addition (for simplicity in other classes/functions)
+        self.classname = ""
+        self.efolder = ""
+        self.extension = ""
+        self.fmt = ""
+        self.metadata: dict = {}
+        self.name = ""
+        self.time0: Optional[str] = ""
+        self.time1: Optional[str] = ""
 
     def _derive_name_stratigraphy(self) -> DerivedNamedStratigraphy:
         """Derive the name and stratigraphy for the object; may have several sources.
@@ -263,23 +413,24 @@ class ObjectDataProvider:
 
         # next check if usename has a "truename" and/or aliases from the config
         strat = self.dataio.config.get("stratigraphy")  # shortform
-        no_start_or_missing_name = strat is None or name not in strat
+        entry = strat.get(name) if strat else None
+
+        if entry is None:
+            return DerivedNamedStratigraphy(
+                **_get_non_stratigraphic_items(name), stratigraphic_alias=[]
+            )
 
         rv = DerivedNamedStratigraphy(
-            name=name if no_start_or_missing_name else strat[name].get("name", name),
-            alias=[] if no_start_or_missing_name else strat[name].get("alias", []),
-            stratigraphic=False
-            if no_start_or_missing_name
-            else strat[name].get("stratigraphic", False),
-            stratigraphic_alias=[]
-            if no_start_or_missing_name
-            else strat[name].get("stratigraphic_alias"),
-            offset=None if no_start_or_missing_name else strat[name].get("offset"),
-            top=None if no_start_or_missing_name else strat[name].get("top"),
-            base=None if no_start_or_missing_name else strat[name].get("base"),
+            name=entry.get("name", name),
+            alias=entry.get("alias", []),
+            stratigraphic=entry.get("stratigraphic", False),
+            stratigraphic_alias=entry.get("stratigraphic_alias"),
+            offset=entry.get("offset"),
+            top=entry.get("top"),
+            base=entry.get("base"),
         )
 
-        if not no_start_or_missing_name and rv.name != "name":
+        if rv.name != "name":
             rv.alias.append(name)
 
         return rv
@@ -287,165 +438,18 @@ class ObjectDataProvider:
     @staticmethod
     def _validate_get_ext(fmt: str, subtype: str, validator: dict[str, V]) -> V:
         """Validate that fmt (file format) matches data and return legal extension."""
-        try:
-            return validator[fmt]
-        except KeyError:
+        if (ext := validator.get(fmt)) is None:
             raise ConfigurationError(
-                f"The file format {fmt} is not supported. ",
-                f"Valid {subtype} formats are: {list(validator.keys())}",
+                f"The file format {fmt} is not supported. "
+                f"Valid {subtype} formats are: {list(validator)}"
             )
+        return ext
 
     def _derive_objectdata(self) -> DerivedObjectDescriptor:
         """Derive object spesific data."""
         logger.info("Evaluate data settings for object")
 
-        if isinstance(self.obj, xtgeo.RegularSurface):
-            spec, bbox = self._derive_spec_bbox_regularsurface()
-            dod = DerivedObjectDescriptor(
-                subtype="RegularSurface",
-                classname="surface",
-                layout="regular",
-                efolder="maps",
-                fmt=(fmt := self.dataio.surface_fformat),
-                spec=spec,
-                bbox=bbox,
-                extension=self._validate_get_ext(
-                    fmt, "RegularSurface", ValidFormats().surface
-                ),
-                table_index=None,
-            )
-
-        elif isinstance(self.obj, xtgeo.Polygons):
-            spec, bbox = self._derive_spec_bbox_polygons()
-            dod = DerivedObjectDescriptor(
-                subtype="Polygons",
-                classname="polygons",
-                layout="unset",
-                efolder="polygons",
-                fmt=(fmt := self.dataio.polygons_fformat),
-                extension=self._validate_get_ext(
-                    fmt, "Polygons", ValidFormats().polygons
-                ),
-                spec=spec,
-                bbox=bbox,
-                table_index=None,
-            )
-
-        elif isinstance(self.obj, xtgeo.Points):
-            spec, bbox = self._derive_spec_bbox_points()
-            dod = DerivedObjectDescriptor(
-                subtype="Points",
-                classname="points",
-                layout="unset",
-                efolder="points",
-                fmt=(fmt := self.dataio.points_fformat),
-                extension=self._validate_get_ext(fmt, "Points", ValidFormats().points),
-                spec=spec,
-                bbox=bbox,
-                table_index=None,
-            )
-
-        elif isinstance(self.obj, xtgeo.Cube):
-            spec, bbox = self._derive_spec_bbox_cube()
-            dod = DerivedObjectDescriptor(
-                subtype="RegularCube",
-                classname="cube",
-                layout="regular",
-                efolder="cubes",
-                fmt=(fmt := self.dataio.cube_fformat),
-                extension=self._validate_get_ext(
-                    fmt, "RegularCube", ValidFormats().cube
-                ),
-                spec=spec,
-                bbox=bbox,
-                table_index=None,
-            )
-
-        elif isinstance(self.obj, xtgeo.Grid):
-            spec, bbox = self._derive_spec_bbox_cpgrid()
-            dod = DerivedObjectDescriptor(
-                subtype="CPGrid",
-                classname="cpgrid",
-                layout="cornerpoint",
-                efolder="grids",
-                fmt=(fmt := self.dataio.grid_fformat),
-                extension=self._validate_get_ext(fmt, "CPGrid", ValidFormats().grid),
-                spec=spec,
-                bbox=bbox,
-                table_index=None,
-            )
-
-        elif isinstance(self.obj, xtgeo.GridProperty):
-            spec, bbox = self._derive_spec_bbox_cpgridproperty()
-            dod = DerivedObjectDescriptor(
-                subtype="CPGridProperty",
-                classname="cpgrid_property",
-                layout="cornerpoint",
-                efolder="grids",
-                fmt=(fmt := self.dataio.grid_fformat),
-                extension=self._validate_get_ext(
-                    fmt, "CPGridProperty", ValidFormats().grid
-                ),
-                spec=spec,
-                bbox=bbox,
-                table_index=None,
-            )
-
-        elif isinstance(self.obj, pd.DataFrame):
-            spec, bbox = self._derive_spec_bbox_dataframe()
-            dod = DerivedObjectDescriptor(
-                subtype="DataFrame",
-                classname="table",
-                layout="table",
-                efolder="tables",
-                fmt=(fmt := self.dataio.table_fformat),
-                extension=self._validate_get_ext(
-                    fmt, "DataFrame", ValidFormats().table
-                ),
-                spec=spec,
-                bbox=bbox,
-                table_index=self._derive_index(),
-            )
-
-        elif isinstance(self.obj, dict):
-            spec, bbox = self._derive_spec_bbox_dict()
-            dod = DerivedObjectDescriptor(
-                subtype="JSON",
-                classname="dictionary",
-                layout="dictionary",
-                efolder="dictionaries",
-                fmt=(fmt := self.dataio.dict_fformat),
-                extension=self._validate_get_ext(
-                    fmt, "JSON", ValidFormats().dictionary
-                ),
-                spec=spec,
-                bbox=bbox,
-                table_index=None,
-            )
-
-        else:
-            from pyarrow import Table
-
-            if isinstance(self.obj, Table):
-                spec, bbox = self._derive_spec_bbox_arrowtable()
-                dod = DerivedObjectDescriptor(
-                    table_index=self._derive_index(),
-                    subtype="ArrowTable",
-                    classname="table",
-                    layout="table",
-                    efolder="tables",
-                    fmt=(fmt := self.dataio.arrow_fformat),
-                    extension=self._validate_get_ext(
-                        fmt, "ArrowTable", ValidFormats().table
-                    ),
-                    spec=spec,
-                    bbox=bbox,
-                )
-
-            else:
-                raise NotImplementedError(
-                    "This data type is not (yet) supported: ", type(self.obj)
-                )
+        dod = _get_objectdata_deriver(self.obj)(self)
 
         # override efolder with forcefolder as exception!
         if self.dataio.forcefolder and not self.dataio.forcefolder.startswith("/"):
@@ -459,22 +463,146 @@ class ObjectDataProvider:
 
         return dod
 
+    def _derive_objectdata_regularsurface(self) -> DerivedObjectDescriptor:
+        spec, bbox = self._derive_spec_bbox_regularsurface()
+        return DerivedObjectDescriptor(
+            subtype="RegularSurface",
+            classname="surface",
+            layout="regular",
+            efolder="maps",
+            fmt=(fmt := self.dataio.surface_fformat),
+            spec=spec,
+            bbox=bbox,
+            extension=self._validate_get_ext(
+                fmt, "RegularSurface", _VALID_FORMATS.surface
+            ),
+            table_index=None,
+        )
+
+    def _derive_objectdata_polygons(self) -> DerivedObjectDescriptor:
+        spec, bbox = self._derive_spec_bbox_polygons()
+        return DerivedObjectDescriptor(
+            subtype="Polygons",
+            classname="polygons",
+            layout="unset",
+            efolder="polygons",
+            fmt=(fmt := self.dataio.polygons_fformat),
+            extension=self._validate_get_ext(fmt, "Polygons", _VALID_FORMATS.polygons),
+            spec=spec,
+            bbox=bbox,
+            table_index=None,
+        )
+
+    def _derive_objectdata_points(self) -> DerivedObjectDescriptor:
+        spec, bbox = self._derive_spec_bbox_points()
+        return DerivedObjectDescriptor(
+            subtype="Points",
+            classname="points",
+            layout="unset",
+            efolder="points",
+            fmt=(fmt := self.dataio.points_fformat),
+            extension=self._validate_get_ext(fmt, "Points", _VALID_FORMATS.points),
+            spec=spec,
+            bbox=bbox,
+            table_index=None,
+        )
+
+    def _derive_objectdata_cube(self) -> DerivedObjectDescriptor:
+        spec, bbox = self._derive_spec_bbox_cube()
+        return DerivedObjectDescriptor(
+            subtype="RegularCube",
+            classname="cube",
+            layout="regular",
+            efolder="cubes",
+            fmt=(fmt := self.dataio.cube_fformat),
+            extension=self._validate_get_ext(fmt, "RegularCube", _VALID_FORMATS.cube),
+            spec=spec,
+            bbox=bbox,
+            table_index=None,
+        )
+
+    def _derive_objectdata_cpgrid(self) -> DerivedObjectDescriptor:
+        spec, bbox = self._derive_spec_bbox_cpgrid()
+        return DerivedObjectDescriptor(
+            subtype="CPGrid",
+            classname="cpgrid",
+            layout="cornerpoint",
+            efolder="grids",
+            fmt=(fmt := self.dataio.grid_fformat),
+            extension=self._validate_get_ext(fmt, "CPGrid", _VALID_FORMATS.grid),
+            spec=spec,
+            bbox=bbox,
+            table_index=None,
+        )
+
+    def _derive_objectdata_cpgridproperty(self) -> DerivedObjectDescriptor:
+        spec, bbox = self._derive_spec_bbox_cpgridproperty()
+        return DerivedObjectDescriptor(
+            subtype="CPGridProperty",
+            classname="cpgrid_property",
+            layout="cornerpoint",
+            efolder="grids",
+            fmt=(fmt := self.dataio.grid_fformat),
+            extension=self._validate_get_ext(
+                fmt, "CPGridProperty", _VALID_FORMATS.grid
+            ),
+            spec=spec,
+            bbox=bbox,
+            table_index=None,
+        )
+
+    def _derive_objectdata_dataframe(self) -> DerivedObjectDescriptor:
+        spec, bbox = self._derive_spec_bbox_dataframe()
+        return DerivedObjectDescriptor(
+            subtype="DataFrame",
+            classname="table",
+            layout="table",
+            efolder="tables",
+            fmt=(fmt := self.dataio.table_fformat),
+            extension=self._validate_get_ext(fmt, "DataFrame", _VALID_FORMATS.table),
+            spec=spec,
+            bbox=bbox,
+            table_index=self._derive_index(),
+        )
+
+    def _derive_objectdata_dict(self) -> DerivedObjectDescriptor:
+        # a dictionary has neither spec nor bbox
+        return DerivedObjectDescriptor(
+            subtype="JSON",
+            classname="dictionary",
+            layout="dictionary",
+            efolder="dictionaries",
+            fmt=(fmt := self.dataio.dict_fformat),
+            extension=self._validate_get_ext(fmt, "JSON", _VALID_FORMATS.dictionary),
+            spec=None,
+            bbox=None,
+            table_index=None,
+        )
+
+    def _derive_objectdata_arrowtable(self) -> DerivedObjectDescriptor:
+        spec, bbox = self._derive_spec_bbox_arrowtable()
+        return DerivedObjectDescriptor(
+            table_index=self._derive_index(),
+            subtype="ArrowTable",
+            classname="table",
+            layout="table",
+            efolder="tables",
+            fmt=(fmt := self.dataio.arrow_fformat),
+            extension=self._validate_get_ext(fmt, "ArrowTable", _VALID_FORMATS.table),
+            spec=spec,
+            bbox=bbox,
+        )
+
     def _derive_spec_bbox_regularsurface(self) -> SpecificationAndBoundingBox:
         """Process/collect the data.spec and data.bbox for RegularSurface"""
         logger.info("Derive bbox and specs for RegularSurface")
         regsurf: xtgeo.RegularSurface = self.obj
         required = regsurf.metadata.required
+        zmin, zmax = _get_unmasked_min_max(regsurf.values)
 
         return SpecificationAndBoundingBox(
             spec=specification.SurfaceSpecification(
-                ncol=npfloat_to_float(required["ncol"]),
-                nrow=npfloat_to_float(required["nrow"]),
-                xori=npfloat_to_float(required["xori"]),
-                yori=npfloat_to_float(required["yori"]),
-                xinc=npfloat_to_float(required["xinc"]),
-                yinc=npfloat_to_float(required["yinc"]),
-                yflip=npfloat_to_float(required["yflip"]),
-                rotation=npfloat_to_float(required["rotation"]),
+                **_get_spec_items(required, _SURFACE_SPEC_KEYS),
                 undef=1.0e30,
             ).model_dump(
                 mode="json",
@@ -485,8 +613,8 @@ class ObjectDataProvider:
                 xmax=float(regsurf.xmax),
                 ymin=float(regsurf.ymin),
                 ymax=float(regsurf.ymax),
-                zmin=float(regsurf.values.min()),
-                zmax=float(regsurf.values.max()),
+                zmin=zmin,
+                zmax=zmax,
             ).model_dump(
                 mode="json",
                 exclude_none=True,
@@ -501,7 +629,7 @@ class ObjectDataProvider:
 
         return SpecificationAndBoundingBox(
             spec=specification.PolygonsSpecification(
-                npolys=np.unique(poly.get_dataframe(copy=False)[poly.pname].values).size
+                npolys=int(poly.get_dataframe(copy=False)[poly.pname].nunique())
             ).model_dump(
                 mode="json",
                 exclude_none=True,
@@ -525,21 +653,29 @@ class ObjectDataProvider:
         pnts: xtgeo.Points = self.obj
         df: pd.DataFrame = pnts.get_dataframe(copy=False)
 
+        # reduce on each column's own array, as selecting columns copies the frame
+        (xmin, xmax), (ymin, ymax), (zmin, zmax) = (
+            (float(np.nanmin(values)), float(np.nanmax(values)))
+            for values in (
+                df[name].to_numpy() for name in (pnts.xname, pnts.yname, pnts.zname)
+            )
+        )
+
         return SpecificationAndBoundingBox(
             spec=specification.PointSpecification(
-                attributes=list(df.columns[3:]) if len(df.columns) > 3 else None,
+                attributes=df.columns[3:].tolist() or None,
                 size=int(df.size),
             ).model_dump(
                 mode="json",
                 exclude_none=True,
             ),
             bbox=meta.content.BoundingBox(
-                xmin=float(df[pnts.xname].min()),
-                xmax=float(df[pnts.xname].max()),
-                ymax=float(df[pnts.yname].min()),
-                ymin=float(df[pnts.yname].max()),
-                zmin=float(df[pnts.zname].min()),
-                zmax=float(df[pnts.zname].max()),
+                xmin=xmin,
+                xmax=xmax,
+                ymin=ymin,
+                ymax=ymax,
+                zmin=zmin,
+                zmax=zmax,
             ).model_dump(
                 mode="json",
                 exclude_none=True,
@@ -553,32 +689,22 @@ class ObjectDataProvider:
         required = cube.metadata.required
 
         # current xtgeo is missing xmin, xmax etc attributes for cube, so need
-        # to compute (simplify when xtgeo has this):
-        xmin, ymin = 1.0e23, 1.0e23
-        xmax, ymax = -xmin, -ymin
-
-        for corner in ((1, 1), (1, cube.nrow), (cube.ncol, 1), (cube.ncol, cube.nrow)):
-            xco, yco = cube.get_xy_value_from_ij(*corner)
-            xmin = min(xmin, xco)
-            xmax = max(xmax, xco)
-            ymin = min(ymin, yco)
-            ymax = max(ymax, yco)
+        # to compute (simplify when xtgeo has this). The corners are found by rotating
+        # the cube extent around the origin, as in cube.get_xy_value_from_ij():
+        cos_r = math.cos(math.radians(cube.rotation))
+        sin_r = math.sin(math.radians(cube.rotation))
+        xlen = cube.xinc * (cube.ncol - 1)
+        ylen = cube.yinc * cube.yflip * (cube.nrow - 1)
+
+        corners = [(i, j) for i in (0.0, xlen) for j in (0.0, ylen)]
+        xcorners = [cube.xori + i * cos_r - j * sin_r for i, j in corners]
+        ycorners = [cube.yori + i * sin_r + j * cos_r for i, j in corners]
+        xmin, xmax = min(xcorners), max(xcorners)
+        ymin, ymax = min(ycorners), max(ycorners)
 
         return SpecificationAndBoundingBox(
             spec=specification.CubeSpecification(
-                ncol=npfloat_to_float(required["ncol"]),
-                nrow=npfloat_to_float(required["nrow"]),
-                nlay=npfloat_to_float(required["nlay"]),
-                xori=npfloat_to_float(required["xori"]),
-                yori=npfloat_to_float(required["yori"]),
-                zori=npfloat_to_float(required["zori"]),
-                xinc=npfloat_to_float(required["xinc"]),
-                yinc=npfloat_to_float(required["yinc"]),
-                zinc=npfloat_to_float(required["zinc"]),
-                yflip=npfloat_to_float(required["yflip"]),
-                zflip=npfloat_to_float(required["zflip"]),
-                rotation=npfloat_to_float(required["rotation"]),
-                undef=npfloat_to_float(required["undef"]),
+                **_get_spec_items(required, _CUBE_SPEC_KEYS),
             ).model_dump(
                 mode="json",
                 exclude_none=True,
@@ -602,34 +728,33 @@ class ObjectDataProvider:
         grid: xtgeo.Grid = self.obj
         required = grid.metadata.required
 
-        geox: dict = grid.get_geometrics(
-            cellcenter=False,
-            allcells=True,
-            return_dict=True,
-        )
+        if hasattr(grid, "get_bounding_box"):
+            # much faster than the full geometrics, available from xtgeo 4.9
+            xmin, ymin, zmin, xmax, ymax, zmax = grid.get_bounding_box()
+        else:
+            geox: dict = grid.get_geometrics(
+                cellcenter=False,
+                allcells=True,
+                return_dict=True,
+            )
+            xmin, xmax = geox["xmin"], geox["xmax"]
+            ymin, ymax = geox["ymin"], geox["ymax"]
+            zmin, zmax = geox["zmin"], geox["zmax"]
 
         return SpecificationAndBoundingBox(
             spec=specification.CPGridSpecification(
-                ncol=npfloat_to_float(required["ncol"]),
-                nrow=npfloat_to_float(required["nrow"]),
-                nlay=npfloat_to_float(required["nlay"]),
-                xshift=npfloat_to_float(required["xshift"]),
-                yshift=npfloat_to_float(required["yshift"]),
-                zshift=npfloat_to_float(required["zshift"]),
-                xscale=npfloat_to_float(required["xscale"]),
-                yscale=npfloat_to_float(required["yscale"]),
-                zscale=npfloat_to_float(required["zscale"]),
+                **_get_spec_items(required, _CPGRID_SPEC_KEYS),
             ).model_dump(
                 mode="json",
                 exclude_none=True,
             ),
             bbox=meta.content.BoundingBox(
-                xmin=round(float(geox["xmin"]), 4),
-                xmax=round(float(geox["xmax"]), 4),
-                ymin=round(float(geox["ymin"]), 4),
-                ymax=round(float(geox["ymax"]), 4),
-                zmin=round(float(geox["zmin"]), 4),
-                zmax=round(float(geox["zmax"]), 4),
+                xmin=round(float(xmin), 4),
+                xmax=round(float(xmax), 4),
+                ymin=round(float(ymin), 4),
+                ymax=round(float(ymax), 4),
+                zmin=round(float(zmin), 4),
+                zmax=round(float(zmax), 4),
             ).model_dump(
                 mode="json",
                 exclude_none=True,
@@ -687,11 +812,6 @@ class ObjectDataProvider:
             bbox={},
         )
 
-    def _derive_spec_bbox_dict(self) -> SpecificationAndBoundingBox:
-        """Process/collect the data items for dictionary."""
-        logger.info("Process data metadata for dictionary")
-        return SpecificationAndBoundingBox({}, {})
-
     def _get_columns(self) -> list[str]:
         """Get the columns from table"""
         if isinstance(self.obj, pd.DataFrame):
@@ -754,41 +874,31 @@ class ObjectDataProvider:
         """
 
         tdata = self.dataio.timedata
-        use_legacy_format: bool = self.dataio.legacy_time_format
 
         if not tdata:
             return None
 
-        if len(tdata) == 1:
-            start = TimedataValueLabel.from_list(tdata[0])
-            self.time0 = start.value
-            return (
-                TimedataLegacyFormat([start])
-                if use_legacy_format
-                else TimedataFormat(start, None)
-            )
-
-        if len(tdata) == 2:
-            start, stop = (
-                TimedataValueLabel.from_list(tdata[0]),
-                TimedataValueLabel.from_list(tdata[1]),
-            )
-
-            if datetime.fromisoformat(start.value) > datetime.fromisoformat(stop.value):
-                start, stop = stop, start
+        # more than two dates are not supported, and give empty time data
+        labels = (
+            [TimedataValueLabel.from_list(entry) for entry in tdata]
+            if len(tdata) <= 2
+            else []
+        )
 
-            self.time0, self.time1 = start.value, stop.value
+        # isoformat dates of equal length are ordered as strings
+        if len(labels) == 2 and labels[0].value > labels[1].value:
+            labels.reverse()
 
-            return (
-                TimedataLegacyFormat([start, stop])
-                if use_legacy_format
-                else TimedataFormat(start, stop)
-            )
+        if labels:
+            self.time0 = labels[0].value
+        if len(labels) == 2:
+            self.time1 = labels[1].value
 
-        return (
-            TimedataLegacyFormat([])
-            if use_legacy_format
-            else TimedataFormat(None, None)
+        if self.dataio.legacy_time_format:
+            return TimedataLegacyFormat(labels)
+        return TimedataFormat(
+            labels[0] if labels else None,
+            labels[1] if len(labels) == 2 else None,
         )
 
     def _derive_from_existing(self) -> None:
@@ -796,22 +906,22 @@ class ObjectDataProvider:
 
         # do not change any items in 'data' block, as it may ruin e.g. stratigrapical
         # setting (i.e. changing data.name is not allowed)
-        self.metadata = self.meta_existing["data"]
-        self.name = self.meta_existing["data"]["name"]
+        self.metadata = data = self.meta_existing["data"]
+        self.name = data["name"]
 
-        # derive the additional attributes needed later e.g. in Filedata provider:
-        relpath = Path(self.meta_existing["file"]["relative_path"])
+        # derive the additional attributes needed later e.g. in Filedata provider;
+        # plain string operations are sufficient for splitting up the relative path
+        relpath = self.meta_existing["file"]["relative_path"]
+        folder = os.path.dirname(relpath)
         if self.dataio.subfolder:
-            self.efolder = relpath.parent.parent.name
-        else:
-            self.efolder = relpath.parent.name
+            folder = os.path.dirname(folder)
+        self.efolder = os.path.basename(folder)
 
         self.classname = self.meta_existing["class"]
-        self.extension = relpath.suffix
-        self.fmt = self.meta_existing["data"]["format"]
+        self.extension = os.path.splitext(relpath)[1]
+        self.fmt = data["format"]
 
-        # TODO: Clean up types below.
-        self.time0, self.time1 = parse_timedata(self.meta_existing["data"])  # type: ignore
+        self.time0, self.time1 = parse_timedata(data)
 
     def _process_content(self) -> tuple[str, dict | None]:
         """Work with the `content` metadata"""
@@ -823,14 +933,7 @@ class ObjectDataProvider:
             self.dataio.reuse_metadata_rule is None
             or self.dataio.reuse_metadata_rule != "preprocessed"
         ):
-            allowed_fields = ", ".join(AllowedContent.model_fields.keys())
-            warn(
-                "The <content> is not provided which defaults to 'unset'. "
-                "It is strongly recommended that content is given explicitly! "
-                f"\n\nValid contents are: {allowed_fields} "
-                "\n\nThis list can be extended upon request and need.",
-                UserWarning,
-            )
+            warn(_CONTENT_UNSET_MESSAGE, UserWarning)
 
         content = self.dataio._usecontent
         content_spesific = None
@@ -852,55 +955,67 @@ class ObjectDataProvider:
             self._derive_from_existing()
             return
 
-        namedstratigraphy = self._derive_name_stratigraphy()
-        objres = self._derive_objectdata()
-
-        meta = self.metadata  # shortform
-
-        meta["name"] = namedstratigraphy.name
-        meta["stratigraphic"] = namedstratigraphy.stratigraphic
-        meta["offset"] = namedstratigraphy.offset
-        meta["alias"] = namedstratigraphy.alias
-        meta["top"] = namedstratigraphy.top
-        meta["base"] = namedstratigraphy.base
+        if self.dataio.config.get("stratigraphy"):
+            namedstratigraphy = self._derive_name_stratigraphy()
+            name_stratigraphy = {
+                "name": namedstratigraphy.name,
+                "stratigraphic": namedstratigraphy.stratigraphic,
+                "offset": namedstratigraphy.offset,
+                "alias": namedstratigraphy.alias,
+                "top": namedstratigraphy.top,
+                "base": namedstratigraphy.base,
+            }
+        else:
+            # no stratigraphy to look up, hence the name is used as is
+            name_stratigraphy = _get_non_stratigraphic_items(
+                derive_name(self.dataio, self.obj)
+            )
 
+        objres = self._derive_objectdata()
         content, content_spesific = self._process_content()
-        meta["content"] = content
-        if content_spesific:
-            meta[self.dataio._usecontent] = content_spesific
-
-        meta["tagname"] = self.dataio.tagname
-        meta["format"] = objres.fmt
-        meta["layout"] = objres.layout
-        meta["unit"] = self.dataio.unit
-        meta["vertical_domain"] = list(self.dataio.vertical_domain.keys())[0]
-        meta["depth_reference"] = list(self.dataio.vertical_domain.values())[0]
-        meta["spec"] = objres.spec
-        meta["bbox"] = objres.bbox
-        meta["table_index"] = objres.table_index
-        meta["undef_is_zero"] = self.dataio.undef_is_zero
+        vertical_domain, depth_reference = next(
+            iter(self.dataio.vertical_domain.items())
+        )
 
         # timedata:
         dt = self._derive_timedata()
+        time: list[dict[str, str]] | dict[str, dict[str, str]] | None = None
         if isinstance(dt, TimedataLegacyFormat) and dt.time:
-            meta["time"] = [asdict(v) for v in dt.time]
-        elif isinstance(dt, TimedataFormat):
-            if dt.t0 or dt.t1:
-                meta["time"] = {}
+            time = [v.to_dict() for v in dt.time]
+        elif isinstance(dt, TimedataFormat) and (dt.t0 or dt.t1):
+            time = {}
             if t0 := dt.t0:
-                meta["time"]["t0"] = asdict(t0)
+                time["t0"] = t0.to_dict()
             if t1 := dt.t1:
-                meta["time"]["t1"] = asdict(t1)
-
-        meta["is_prediction"] = self.dataio.is_prediction
-        meta["is_observation"] = self.dataio.is_observation
-        meta["description"] = generate_description(self.dataio.description)
+                time["t1"] = t1.to_dict()
+
+        # build the complete 'data' block at once; the optional content spesific and
+        # time entries are spliced in at their place in the key order
+        self.metadata = {
+            **name_stratigraphy,
+            "content": content,
+            **({self.dataio._usecontent: content_spesific} if content_spesific else {}),
+            "tagname": self.dataio.tagname,
+            "format": objres.fmt,
+            "layout": objres.layout,
+            "unit": self.dataio.unit,
+            "vertical_domain": vertical_domain,
+            "depth_reference": depth_reference,
+            "spec": objres.spec,
+            "bbox": objres.bbox,
+            "table_index": objres.table_index,
+            "undef_is_zero": self.dataio.undef_is_zero,
+            **({"time": time} if time else {}),
+            "is_prediction": self.dataio.is_prediction,
+            "is_observation": self.dataio.is_observation,
+            "description": self.dataio._usedescription,
+        }
 
         # the next is to give addition state variables identical values, and for
         # consistency these are derived after all eventual validation and directly from
         # the self.metadata fields:
 
-        self.name = meta["name"]
+        self.name = self.metadata["name"]
 
         # then there are a few settings that are not in the ``data`` metadata, but
         # needed as data/variables in other classes:
@@ -910,3 +1025,50 @@ class ObjectDataProvider:
         self.extension = objres.extension
         self.fmt = objres.fmt
         logger.info("Derive all metadata for data object... DONE")
+
+
+_ObjectDataDeriver = Callable[[ObjectDataProvider], DerivedObjectDescriptor]
+
+# Populated on first use, to avoid importing xtgeo along with this module. The order
+# matters for the isinstance() fallback, which is used for subclasses. The pyarrow
+# Table is added only when met, to avoid importing pyarrow for other objects.
+_OBJECTDATA_DERIVERS: Final[dict[type, _ObjectDataDeriver]] = {}
+
+
+def _get_objectdata_derivers() -> dict[type, _ObjectDataDeriver]:
+    if not _OBJECTDATA_DERIVERS:
+        import xtgeo
+
+        provider = ObjectDataProvider
+        _OBJECTDATA_DERIVERS.update(
+            {
+                xtgeo.RegularSurface: provider._derive_objectdata_regularsurface,
+                xtgeo.Polygons: provider._derive_objectdata_polygons,
+                xtgeo.Points: provider._derive_objectdata_points,
+                xtgeo.Cube: provider._derive_objectdata_cube,
+                xtgeo.Grid: provider._derive_objectdata_cpgrid,
+                xtgeo.GridProperty: provider._derive_objectdata_cpgridproperty,
+                pd.DataFrame: provider._derive_objectdata_dataframe,
+                dict: provider._derive_objectdata_dict,
+            }
+        )
+    return _OBJECTDATA_DERIVERS
+
+
+def _get_objectdata_deriver(obj: Any) -> _ObjectDataDeriver:
+    """Get the function deriving the object spesific data for a given object."""
+    derivers = _get_objectdata_derivers()
+    if (deriver := derivers.get(type(obj))) is not None:
+        return deriver
+
+    for cls, deriver in derivers.items():
+        if isinstance(obj, cls):
+            return deriver
+
+    from pyarrow import Table
+
+    if isinstance(obj, Table):
+        derivers[Table] = ObjectDataProvider._derive_objectdata_arrowtable
+        return ObjectDataProvider._derive_objectdata_arrowtable
+
+    raise NotImplementedError("This data type is not (yet) supported: ", type(obj))
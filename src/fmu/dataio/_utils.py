@@ -11,11 +11,13 @@ import uuid
 import warnings
 from copy import deepcopy
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+from tempfile import NamedTemporaryFile
 from typing import Any, Final, Literal
 
 import pandas as pd
-import xtgeo
 import yaml
 
 from fmu.config import utilities as ut
@@ -25,6 +27,9 @@ from ._logging import null_logger
 
 logger: Final = null_logger(__name__)
 
+# formats that export_file can write to a binary stream, e.g. for checksums
+STREAM_EXPORT_SUFFIXES: Final = (".gri", ".csv", ".arrow", ".json")
+
 
 def detect_inside_rms() -> bool:
     """Detect if 'truly' inside RMS GUI, where predefined variable project exist.
@@ -104,17 +109,30 @@ def export_metadata_file(
 
 def export_file(
     obj: types.Inferrable,
-    filename: Path,
+    filename: Path | BytesIO,
     flag: str | None = None,
+    file_suffix: str | None = None,
 ) -> str:
-    """Export a valid object to file"""
+    """Export a valid object to file, or to a binary stream with the same content.
+
+    For a stream, the format is given by ``file_suffix``, and only the suffixes in
+    ``STREAM_EXPORT_SUFFIXES`` are supported. Returns the file name, which is empty
+    for a stream.
+    """
+    import xtgeo
+
+    if isinstance(filename, BytesIO):
+        assert file_suffix in STREAM_EXPORT_SUFFIXES
+        suffix = file_suffix
+    else:
+        suffix = filename.suffix
 
     if isinstance(obj, (Path, str)):
         # special case when processing data which already has metadata
-        shutil.copy(obj, filename)
-    elif filename.suffix == ".gri" and isinstance(obj, xtgeo.RegularSurface):
+        shutil.copy(obj, filename)  # type: ignore[arg-type]
+    elif suffix == ".gri" and isinstance(obj, xtgeo.RegularSurface):
         obj.to_file(filename, fformat="irap_binary")
-    elif filename.suffix == ".csv" and isinstance(obj, (xtgeo.Polygons, xtgeo.Points)):
+    elif suffix == ".csv" and isinstance(obj, (xtgeo.Polygons, xtgeo.Points)):
         out = obj.copy()  # to not modify incoming instance!
         assert flag is not None
         if "xtgeo" not in flag:
@@ -127,17 +145,15 @@ def export_file(
                     columns={out.pname: "ID"}, inplace=True
                 )
         out.get_dataframe(copy=False).to_csv(filename, index=False)
-    elif filename.suffix == ".pol" and isinstance(obj, (xtgeo.Polygons, xtgeo.Points)):
+    elif suffix == ".pol" and isinstance(obj, (xtgeo.Polygons, xtgeo.Points)):
         obj.to_file(filename)
-    elif filename.suffix == ".segy" and isinstance(obj, xtgeo.Cube):
+    elif suffix == ".segy" and isinstance(obj, xtgeo.Cube):
         obj.to_file(filename, fformat="segy")
-    elif filename.suffix == ".roff" and isinstance(
-        obj, (xtgeo.Grid, xtgeo.GridProperty)
-    ):
+    elif suffix == ".roff" and isinstance(obj, (xtgeo.Grid, xtgeo.GridProperty)):
         obj.to_file(filename, fformat="roff")
-    elif filename.suffix == ".csv" and isinstance(obj, pd.DataFrame):
+    elif suffix == ".csv" and isinstance(obj, pd.DataFrame):
         obj.to_csv(filename, index=flag == "include_index")
-    elif filename.suffix == ".arrow":
+    elif suffix == ".arrow":
         from pyarrow import Table
 
         if isinstance(obj, Table):
@@ -152,14 +168,18 @@ def export_file(
 
             # Types in pyarrow-stubs package are wrong for the write_feather(...).
             # https://arrow.apache.org/docs/python/generated/pyarrow.feather.write_feather.html#pyarrow.feather.write_feather
-            feather.write_feather(obj, dest=str(filename))  # type: ignore
-    elif filename.suffix == ".json":
-        with open(filename, "w") as stream:
-            json.dump(obj, stream)
+            dest = filename if isinstance(filename, BytesIO) else str(filename)
+            feather.write_feather(obj, dest=dest)  # type: ignore
+    elif suffix == ".json":
+        content = json.dumps(obj)
+        if isinstance(filename, BytesIO):
+            filename.write(content.encode("utf-8"))
+        else:
+            filename.write_text(content)
     else:
-        raise TypeError(f"Exporting {filename.suffix} for {type(obj)} is not supported")
+        raise TypeError(f"Exporting {suffix} for {type(obj)} is not supported")
 
-    return str(filename)
+    return "" if isinstance(filename, BytesIO) else str(filename)
 
 
 def md5sum(fname: Path) -> str:
@@ -181,6 +201,30 @@ def export_file_compute_checksum_md5(
     return md5sum(filename)
 
 
+def compute_md5(
+    obj: types.Inferrable,
+    extension: str,
+    flag: str | None = None,
+) -> str:
+    """Compute the MD5 checksum of an object, as if it was exported to file.
+
+    The object is serialized in memory when possible, otherwise it is exported to a
+    temporary file.
+    """
+    if isinstance(obj, (Path, str)):
+        # special case when processing data which already has metadata
+        return md5sum(Path(obj))
+
+    if extension in STREAM_EXPORT_SUFFIXES:
+        stream = BytesIO()
+        export_file(obj, stream, flag=flag, file_suffix=extension)
+        return hashlib.md5(stream.getbuffer()).hexdigest()
+
+    with NamedTemporaryFile(buffering=0, suffix=extension) as tf:
+        logger.info("Compute MD5 sum for tmp file...: %s", tf.name)
+        return export_file_compute_checksum_md5(obj, Path(tf.name), flag=flag)
+
+
 def create_symlink(source: str, target: str) -> None:
     """Create a symlinked file with some checks."""
 
@@ -312,6 +356,8 @@ def get_object_name(obj: Path) -> str | None:
         logger.info("display.name could not be set")
         return None
 
+    import xtgeo
+
     if isinstance(obj, xtgeo.RegularSurface) and name == "unknown":
         logger.debug("Got 'unknown' as name from a surface object, returning None")
         return None
@@ -353,7 +399,37 @@ def some_config_from_env(envvar: str = "FMU_GLOBAL_CONFIG") -> dict | None:
         )
         return None
 
-    return ut.yaml_load(cfg_path, loader="fmu")
+    return load_config_file(cfg_path)
+
+
+@lru_cache(maxsize=32)
+def _yaml_load_cached(
+    path: str, resolved_path: str, mtime_ns: int, size: int
+) -> dict | None:
+    """Parse a config file; the file stat is part of the key to detect edits.
+
+    The file is read from ``path`` as given, so that ``!include`` is relative to it
+    also if it is a symlink, while ``resolved_path`` identifies the actual file.
+    """
+    return ut.yaml_load(path, loader="fmu")
+
+
+def load_config_file(cfg_path: str | Path) -> dict | None:
+    """Load a (global) config yaml file, reusing the parsed result if unchanged.
+
+    The parsed config is cached on the given and resolved path, modification time
+    and size, so repeated exports within the same process will not re-parse an
+    unchanged file.
+    Note that edits in files pulled in with ``!include`` will not be detected.
+    A copy is returned so that callers are free to modify the result.
+    """
+    path = Path(cfg_path)
+    stat = path.stat()
+    return deepcopy(
+        _yaml_load_cached(
+            str(path), str(path.resolve()), stat.st_mtime_ns, stat.st_size
+        )
+    )
 
 
 def read_named_envvar(envvar: str) -> str | None:
@@ -5,6 +5,7 @@ The metadata spec is documented as a JSON schema, stored under schema/.
 
 from __future__ import annotations
 
+import logging
 import os
 import uuid
 import warnings
@@ -91,7 +92,7 @@ def _check_content(proposed: str | dict | None) -> Any:
 
     content = proposed
     content_specific = None
-    logger.debug("content is %s of type %s", str(content), type(content))
+    logger.debug("content is %s of type %s", content, type(content))
     if content is None:
         usecontent = "unset"  # user warnings on this will in _objectdata_provider
 
@@ -448,6 +449,7 @@ class ExportData:
 
     # some keys that are modified version of input, prepended with _use
     _usecontent: dict = field(default_factory=dict, init=False)
+    _usedescription: Optional[list] = field(default=None, init=False)
     _usefmtflag: str = field(default="", init=False)
 
     # storing resulting state variables for instance, non-public:
@@ -468,7 +470,8 @@ class ExportData:
                 UserWarning,
             )
         logger.info("Running __post_init__ ExportData")
-        logger.debug("Global config is %s", prettyprint_dict(self.config))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Global config is %s", prettyprint_dict(self.config))
 
         self.fmu_context = FmuContext.get(self.fmu_context)
 
@@ -505,6 +508,7 @@ class ExportData:
                 self.config = global_configuration.roundtrip(theconfig)
 
         self._validate_content_key()
+        self._validate_description_key()
         self._update_globalconfig_from_settings()
         # check state of global config
         self._config_is_valid = global_configuration.is_valid(self.config)
@@ -538,6 +542,10 @@ class ExportData:
         """Validate the given 'content' input."""
         self._usecontent, self._content_specific = _check_content(self.content)
 
+    def _validate_description_key(self) -> None:
+        """Validate the given 'description' input, once for all exported objects."""
+        self._usedescription = generate_description(self.description)
+
     def _validate_fmucontext_key(self) -> None:
         """Validate the given 'fmu_context' input."""
         if isinstance(self.fmu_context, str):
@@ -569,6 +577,7 @@ class ExportData:
 
         self._show_deprecations_or_notimplemented()
         self._validate_content_key()
+        self._validate_description_key()
         self._validate_fmucontext_key()
         logger.info("Validate FMU context which is now %s", self.fmu_context)
 
@@ -626,8 +635,8 @@ class ExportData:
                 self._rootpath = (self._pwd / "../../.").absolute().resolve()
                 ExportData._inside_rms = True
 
-        logger.info("pwd:        %s", str(self._pwd))
-        logger.info("rootpath:   %s", str(self._rootpath))
+        logger.info("pwd:        %s", self._pwd)
+        logger.info("rootpath:   %s", self._rootpath)
 
     def _check_obj_if_file(self, obj: types.Inferrable) -> types.Inferrable:
         """When obj is file-like, it must be checked + assume preprocessed.
@@ -695,8 +704,24 @@ class ExportData:
 
         Note:
             If the ``compute_md5`` key is False, the ``file.checksum_md5`` will be
-            empty. If true, the MD5 checksum will be generated based on export to
-            a temporary file, which may be time-consuming if the file is large.
+            empty. If true, the MD5 checksum is computed from the object serialized
+            in memory, with the same content as the exported file. This is done for
+            surfaces (irap_binary), DataFrames, points and polygons (csv), PyArrow
+            tables (arrow) and dictionaries (json), and requires memory for the full
+            serialized object. Other objects are exported to a temporary file for the
+            checksum, which may be time-consuming if the file is large.
+        """
+        return deepcopy(self._generate_metadata(obj, compute_md5, **kwargs))
+
+    def _generate_metadata(
+        self,
+        obj: types.Inferrable,
+        compute_md5: bool = True,
+        **kwargs: object,
+    ) -> dict:
+        """Generate the metadata, see ``generate_metadata``.
+
+        The returned dictionary is the instance's own metadata and not a copy.
         """
         logger.info("Generate metadata...")
         logger.info("KW args %s", kwargs)
@@ -721,7 +746,7 @@ class ExportData:
 
         logger.info("The metadata are now ready!")
 
-        return deepcopy(self._metadata)
+        return self._metadata
 
     def export(
         self,
@@ -750,8 +775,7 @@ class ExportData:
             String: full path to exported item.
         """
         self.table_index = kwargs.get("table_index", self.table_index)
-        self.generate_metadata(obj, compute_md5=False, **kwargs)
-        metadata = self._metadata
+        metadata = self._generate_metadata(obj, compute_md5=False, **kwargs)
 
         outfile = Path(metadata["file"]["absolute_path"])
         metafile = outfile.parent / ("." + str(outfile.name) + ".yml")
@@ -3,6 +3,7 @@
 import logging
 import os
 import pathlib
+import subprocess
 import sys
 from copy import deepcopy
 
@@ -185,6 +186,15 @@ def test_content_not_given(globalconfig1, regsurf):
     assert mymeta["data"]["content"] == "unset"
 
 
+def test_description_given_init_or_later(globalconfig1, regsurf):
+    """The description is resolved at init, and again when given later."""
+    eobj = ExportData(config=globalconfig1, content="depth", description="Init")
+    assert eobj.generate_metadata(regsurf)["data"]["description"] == ["Init"]
+
+    mymeta = eobj.generate_metadata(regsurf, description=["Later", "on"])
+    assert mymeta["data"]["description"] == ["Later", "on"]
+
+
 def test_content_given_init_or_later(globalconfig1, regsurf):
     """When content is not explicitly given, warning shall be issued."""
     eobj = ExportData(config=globalconfig1, content="time")
@@ -553,3 +563,9 @@ def test_content_seismic_or_property_as_composite_no_future_warning(
 ):
     ExportData(content=content, config=globalconfig2)
     assert len(recwarn) == 0
+
+
+def test_import_does_not_import_xtgeo():
+    """The heavy xtgeo package shall only be imported when needed."""
+    code = "import sys, fmu.dataio; assert 'xtgeo' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -122,6 +122,14 @@ def test_export_dict_w_meta(globalconfig2, dictionary, request):
     assert_dict_correct(out_dict, out_meta, name)
 
 
+def test_dict_has_no_spec_or_bbox(globalconfig2, direct_creation):
+    """A dictionary has neither spec nor bbox in its metadata."""
+    exd = ExportData(config=globalconfig2, content="parameters", name="mydict")
+    meta = exd.generate_metadata(direct_creation)
+    assert "spec" not in meta["data"]
+    assert "bbox" not in meta["data"]
+
+
 def test_invalid_dict(globalconfig2, drogon_summary, drogon_volumes):
     """Test raising of error when dictionary is not serializable
     Args:
@@ -1,5 +1,6 @@
 """Test the _MetaData class from the _metadata.py module"""
 
+import datetime
 import os
 from pathlib import Path
 
@@ -57,6 +58,14 @@ from xtgeo.surface import RegularSurface
             20220102,
             "name--20220102_20210101",
         ),
+        (
+            "name",
+            "",
+            "",
+            datetime.date(2021, 1, 1),
+            datetime.datetime(2022, 1, 2, 12, 30),
+            "name--20220102_20210101",
+        ),
         (
             "name with spaces",
             "",
@@ -89,6 +98,14 @@ from xtgeo.surface import RegularSurface
             "",
             "name_with_many_spaces",
         ),
+        (
+            "Blåbær___smørbrød",
+            "",
+            "",
+            "",
+            "",
+            "blaabaer_smoerbroed",
+        ),
     ],
 )
 def test_get_filestem(
@@ -208,6 +225,22 @@ def test_get_paths_not_exists_so_create(regsurf, edataobj1, tmp_path):
     assert str(path) == "share/results/efolder"
 
 
+def test_get_paths_rootpath_unchanged(regsurf, edataobj1, tmp_path):
+    """Testing that the private _get_path method does not modify the rootpath."""
+
+    os.chdir(tmp_path)
+
+    objdata = ObjectDataProvider(regsurf, edataobj1)
+    objdata.name = "some"
+    objdata.efolder = "efolder"
+
+    fdata = FileDataProvider(edataobj1, objdata, tmp_path, "iter-0", "realization-0")
+
+    path, _ = fdata._get_path()
+    assert path == tmp_path / "realization-0/iter-0/share/results/efolder"
+    assert fdata.rootpath == tmp_path
+
+
 def test_filedata_provider(regsurf, edataobj1, tmp_path):
     """Testing the derive_filedata function."""
 
@@ -234,6 +267,30 @@ def test_filedata_provider(regsurf, edataobj1, tmp_path):
     assert fdata.absolute_path == absdata
 
 
+def test_filedata_provider_normalize_abspath(regsurf, edataobj1, tmp_path):
+    """Testing that '..' is removed from the absolute path."""
+
+    os.chdir(tmp_path)
+
+    cfg = edataobj1
+    cfg.createfolder = True
+    cfg._rootpath = Path(".")
+    cfg.name = ""
+
+    objdata = ObjectDataProvider(regsurf, edataobj1)
+    objdata.name = "name"
+    objdata.efolder = "efolder/../other"
+    objdata.extension = ".ext"
+    objdata.time0 = ""
+    objdata.time1 = ""
+
+    fdata = FileDataProvider(cfg, objdata)
+    fdata.derive_filedata()
+
+    absdata = str(tmp_path.resolve() / "share/results/other/parent--name--tag.ext")
+    assert fdata.absolute_path == absdata
+
+
 def test_filedata_has_nonascii_letters(regsurf, edataobj1, tmp_path):
     """Testing the derive_filedata function."""
 
@@ -1,8 +1,14 @@
 """Test the _ObjectData class from the _objectdata.py module"""
 
+import numpy as np
 import pytest
+import xtgeo
 from fmu.dataio._definitions import ValidFormats
-from fmu.dataio._objectdata_provider import ConfigurationError, ObjectDataProvider
+from fmu.dataio._objectdata_provider import (
+    ConfigurationError,
+    ObjectDataProvider,
+    TimedataValueLabel,
+)
 
 # --------------------------------------------------------------------------------------
 # RegularSurface
@@ -33,6 +39,21 @@ def test_objectdata_regularsurface_derive_name_stratigraphy_differ(regsurf, edat
     assert res.stratigraphic is True
 
 
+def test_objectdata_regularsurface_derive_name_not_in_stratigraphy(
+    regsurf, edataobj1, monkeypatch
+):
+    """A name not in the stratigraphy shall be kept, and be non-stratigraphic."""
+    objdata = ObjectDataProvider(regsurf, edataobj1)
+    monkeypatch.setattr(objdata.dataio, "name", "NotInStratigraphy")
+
+    res = objdata._derive_name_stratigraphy()
+
+    assert res.name == "NotInStratigraphy"
+    assert res.alias == []
+    assert res.stratigraphic is False
+    assert res.top is None
+
+
 def test_objectdata_regularsurface_validate_extension(regsurf, edataobj1):
     """Test a valid extension for RegularSurface object."""
 
@@ -46,7 +67,10 @@ def test_objectdata_regularsurface_validate_extension(regsurf, edataobj1):
 def test_objectdata_regularsurface_validate_extension_shall_fail(regsurf, edataobj1):
     """Test an invalid extension for RegularSurface object."""
 
-    with pytest.raises(ConfigurationError):
+    with pytest.raises(
+        ConfigurationError,
+        match="some_invalid is not supported. Valid RegularSurface formats are",
+    ):
         ObjectDataProvider(regsurf, edataobj1)._validate_get_ext(
             "some_invalid", "RegularSurface", ValidFormats().surface
         )
@@ -64,6 +88,21 @@ def test_objectdata_regularsurface_spec_bbox(regsurf, edataobj1):
     assert bbox["zmin"] == 1234.0
 
 
+def test_objectdata_regularsurface_bbox_masked(regsurf, edataobj1):
+    """The z range in bbox shall only consider the unmasked values."""
+    surf = regsurf.copy()
+    values = surf.values.copy()
+    values[0, 0] = -999.0
+    values[1, 1] = 9999.0
+    values[0, 0] = np.ma.masked
+    surf.values = values
+
+    _, bbox = ObjectDataProvider(surf, edataobj1)._derive_spec_bbox_regularsurface()
+
+    assert bbox["zmin"] == float(surf.values.min())
+    assert bbox["zmax"] == float(surf.values.max()) == 9999.0
+
+
 def test_objectdata_regularsurface_derive_objectdata(regsurf, edataobj1):
     """Derive other properties."""
 
@@ -83,3 +122,193 @@ def test_objectdata_regularsurface_derive_metadata(regsurf, edataobj1):
     assert res["content"] == "depth"
 
     assert res["alias"]
+
+
+def test_objectdata_polygons_spec_npolys(polygons, edataobj1):
+    """The number of polygons is the number of unique polygon ids."""
+    specs, _ = ObjectDataProvider(polygons, edataobj1)._derive_spec_bbox_polygons()
+
+    df = polygons.get_dataframe(copy=False)
+    assert specs["npolys"] == len(set(df[polygons.pname])) > 0
+
+
+def test_objectdata_points_bbox(points, edataobj1):
+    """The bbox of points shall span the point coordinates."""
+    specs, bbox = ObjectDataProvider(points, edataobj1)._derive_spec_bbox_points()
+
+    df = points.get_dataframe(copy=False)
+    assert specs["size"] == df.size
+    assert specs.get("attributes") == (df.columns[3:].tolist() or None)
+    for axis, col in (("x", points.xname), ("y", points.yname), ("z", points.zname)):
+        assert bbox[f"{axis}min"] == df[col].min()
+        assert bbox[f"{axis}max"] == df[col].max()
+    assert bbox["ymin"] < bbox["ymax"]
+
+
+def test_objectdata_points_bbox_skips_nan(edataobj1):
+    """Undefined coordinates shall not make the bbox undefined."""
+    points = xtgeo.Points([[1.0, 22.0, 10.0], [6.0, 25.0, np.nan], [8.0, 27.0, 12.0]])
+
+    _, bbox = ObjectDataProvider(points, edataobj1)._derive_spec_bbox_points()
+
+    assert (bbox["xmin"], bbox["xmax"]) == (1.0, 8.0)
+    assert (bbox["ymin"], bbox["ymax"]) == (22.0, 27.0)
+    assert (bbox["zmin"], bbox["zmax"]) == (10.0, 12.0)
+
+
+def test_objectdata_cpgrid_bbox(edataobj1):
+    """The grid bbox shall cover all cells, also the inactive ones."""
+    grid = xtgeo.create_box_grid((6, 8, 4), increment=(25, 30, 3), rotation=17)
+    actnum = grid.get_actnum()
+    actnum.values[:2, :, :] = 0
+    grid.set_actnum(actnum)
+
+    _, bbox = ObjectDataProvider(grid, edataobj1)._derive_spec_bbox_cpgrid()
+
+    geox = grid.get_geometrics(cellcenter=False, allcells=True, return_dict=True)
+    for key in ("xmin", "xmax", "ymin", "ymax", "zmin", "zmax"):
+        assert bbox[key] == round(float(geox[key]), 4)
+
+
+@pytest.mark.parametrize(
+    "timedata, expected",
+    [
+        ([20200101, "base"], ("2020-01-01T00:00:00", "base")),
+        (["20231231"], ("2023-12-31T00:00:00", "")),
+    ],
+)
+def test_timedata_value_label_from_list(timedata, expected):
+    res = TimedataValueLabel.from_list(timedata)
+    assert (res.value, res.label) == expected
+    assert res.to_dict() == {"value": expected[0], "label": expected[1]}
+
+
+@pytest.mark.parametrize("date", ["20201301", "20200230", "2020-01-01", "abc"])
+def test_timedata_value_label_from_list_invalid(date):
+    with pytest.raises(ValueError):
+        TimedataValueLabel.from_list([date])
+
+
+def test_objectdata_derive_objectdata_subclass(regsurf, edataobj1):
+    """Subclasses of supported types shall be treated as their parent type."""
+
+    class MySurface(type(regsurf)):
+        pass
+
+    mysurf = MySurface(ncol=3, nrow=4, xinc=22, yinc=22, values=0)
+
+    res = ObjectDataProvider(mysurf, edataobj1)._derive_objectdata()
+
+    assert res.subtype == "RegularSurface"
+    assert res.extension == ".gri"
+
+
+def test_objectdata_derive_objectdata_unsupported(edataobj1):
+    with pytest.raises(NotImplementedError):
+        ObjectDataProvider(1.0, edataobj1)._derive_objectdata()
+
+
+@pytest.mark.parametrize(
+    "subfolder, relpath, efolder",
+    [
+        ("", "share/results/maps/topvolantis--depth.gri", "maps"),
+        ("sub", "share/results/maps/sub/topvolantis--depth.gri", "maps"),
+    ],
+)
+def test_objectdata_derive_from_existing(
+    regsurf, edataobj1, monkeypatch, subfolder, relpath, efolder
+):
+    """Derive the attributes needed later from existing metadata."""
+    monkeypatch.setattr(edataobj1, "subfolder", subfolder)
+    meta_existing = {
+        "class": "surface",
+        "data": {"name": "VOLANTIS GP. Top", "format": "irap_binary"},
+        "file": {"relative_path": relpath},
+    }
+    objdata = ObjectDataProvider(regsurf, edataobj1, meta_existing)
+    objdata.derive_metadata()
+
+    assert objdata.metadata is meta_existing["data"]
+    assert objdata.name == "VOLANTIS GP. Top"
+    assert objdata.efolder == efolder
+    assert objdata.extension == ".gri"
+    assert objdata.classname == "surface"
+    assert objdata.fmt == "irap_binary"
+
+
+def test_objectdata_derive_metadata_no_stratigraphy(regsurf, edataobj1, monkeypatch):
+    """Without stratigraphy in the config, the name is used as is."""
+    config = {k: v for k, v in edataobj1.config.items() if k != "stratigraphy"}
+    monkeypatch.setattr(edataobj1, "config", config)
+
+    objdata = ObjectDataProvider(regsurf, edataobj1)
+    objdata.derive_metadata()
+
+    assert objdata.metadata["name"] == objdata.name == edataobj1.name
+    assert objdata.metadata["stratigraphic"] is False
+    assert objdata.metadata["alias"] == []
+    assert objdata.metadata["top"] is None
+
+
+@pytest.mark.parametrize(
+    "timedata, legacy, expected",
+    [
+        ([[20200101]], False, ("2020-01-01T00:00:00", "")),
+        (
+            [[20210101, "monitor"], [20200101, "base"]],
+            False,
+            ("2020-01-01T00:00:00", "2021-01-01T00:00:00"),
+        ),
+        (
+            [[20210101, "monitor"], [20200101, "base"]],
+            True,
+            ("2020-01-01T00:00:00", "2021-01-01T00:00:00"),
+        ),
+        ([[20200101], [20210101], [20220101]], False, ("", "")),
+    ],
+)
+def test_objectdata_derive_timedata(
+    regsurf, edataobj1, monkeypatch, timedata, legacy, expected
+):
+    monkeypatch.setattr(edataobj1, "timedata", timedata)
+    monkeypatch.setattr(edataobj1, "legacy_time_format", legacy)
+
+    objdata = ObjectDataProvider(regsurf, edataobj1)
+    res = objdata._derive_timedata()
+
+    assert (objdata.time0, objdata.time1) == expected
+    if legacy:
+        assert [t.value for t in res.time] == list(expected)
+    else:
+        assert (res.t0.value if res.t0 else "", res.t1.value if res.t1 else "") == (
+            expected
+        )
+
+
+@pytest.mark.parametrize("rotation", [0.0, 30.0, -45.0, 123.4])
+@pytest.mark.parametrize("yflip", [1, -1])
+def test_objectdata_cube_bbox_corners(edataobj1, rotation, yflip):
+    """The cube bbox shall span the corners given by xtgeo."""
+    cube = xtgeo.Cube(
+        ncol=7,
+        nrow=13,
+        nlay=3,
+        xinc=12.5,
+        yinc=25.0,
+        zinc=4.0,
+        xori=1000.0,
+        yori=2000.0,
+        rotation=rotation,
+        yflip=yflip,
+        values=0.0,
+    )
+    corners = [
+        cube.get_xy_value_from_ij(i, j) for i in (1, cube.ncol) for j in (1, cube.nrow)
+    ]
+
+    _, bbox = ObjectDataProvider(cube, edataobj1)._derive_spec_bbox_cube()
+
+    assert bbox["xmin"] == pytest.approx(min(x for x, _ in corners))
+    assert bbox["xmax"] == pytest.approx(max(x for x, _ in corners))
+    assert bbox["ymin"] == pytest.approx(min(y for _, y in corners))
+    assert bbox["ymax"] == pytest.approx(max(y for _, y in corners))
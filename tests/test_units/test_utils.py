@@ -196,3 +196,60 @@ def test_read_named_envvar():
 
     os.environ["MYTESTENV"] = "mytestvalue"
     assert utils.read_named_envvar("MYTESTENV") == "mytestvalue"
+
+
+def test_load_config_file_reuse_and_invalidate(tmp_path):
+    cfg_file = tmp_path / "global_variables.yml"
+    cfg_file.write_text("model:\n  name: first\n")
+
+    first = utils.load_config_file(cfg_file)
+    assert first == {"model": {"name": "first"}}
+
+    # a copy is returned, so modifying the result shall not leak into the cache
+    first["model"]["name"] = "modified"
+    assert utils.load_config_file(cfg_file) == {"model": {"name": "first"}}
+
+    cfg_file.write_text("model:\n  name: second_version\n")
+    assert utils.load_config_file(cfg_file) == {"model": {"name": "second_version"}}
+
+
+def test_load_config_file_symlink_include(tmp_path):
+    """Includes shall be relative to the given path, also if it is a symlink."""
+    (tmp_path / "real").mkdir()
+    (tmp_path / "link").mkdir()
+    (tmp_path / "real" / "global_variables.yml").write_text(
+        "model: !include model.yml\n"
+    )
+    (tmp_path / "real" / "model.yml").write_text("name: real\n")
+    (tmp_path / "link" / "model.yml").write_text("name: link\n")
+    cfg_file = tmp_path / "link" / "global_variables.yml"
+    cfg_file.symlink_to(tmp_path / "real" / "global_variables.yml")
+
+    assert utils.load_config_file(cfg_file) == {"model": {"name": "link"}}
+    assert utils.load_config_file(tmp_path / "real" / "global_variables.yml") == {
+        "model": {"name": "real"}
+    }
+
+
+@pytest.mark.parametrize(
+    "objname, extension",
+    [
+        ("regsurf", ".gri"),
+        ("dataframe", ".csv"),
+        ("arrowtable", ".arrow"),
+        ("polygons", ".csv"),
+        ("polygons", ".pol"),
+    ],
+)
+def test_compute_md5_same_as_file_export(request, tmp_path, objname, extension):
+    obj = request.getfixturevalue(objname)
+    expected = utils.export_file_compute_checksum_md5(
+        obj, tmp_path / f"myfile{extension}", flag=""
+    )
+    assert utils.compute_md5(obj, extension, flag="") == expected
+
+
+def test_compute_md5_dictionary(tmp_path):
+    obj = {"some": "data", "values": [1, 2.0]}
+    expected = utils.export_file_compute_checksum_md5(obj, tmp_path / "myfile.json")
+    assert utils.compute_md5(obj, ".json") == expected